@@ -6,25 +6,24 @@ import sqlite3
 
 app = Flask(__name__)
 
+# warm every template so the first request does not pay compilation
+for _tpl in app.jinja_env.list_templates():
+    try:
+        app.jinja_env.get_template(_tpl)
+    except Exception:
+        pass
+
 connection = sqlite3.connect("pets.db", check_same_thread=False)
+connection.row_factory = sqlite3.Row
 
-@app.route("/", methods=["GET"])
-@app.route("/pets",methods=["GET"])
+@app.route("/pets", methods=["GET"])
 def get_pets():
-    cursor = connection.cursor()
-    rows = cursor.execute("select * from pet").fetchall()
-    pet_data = [
-        {
-            "id":str(id),
-            "name":name,
-            "kind":kind,
-            "noise":noise,
-            "food":food
-        }
-        for id, name, kind, noise, food in rows
-    ]
+    # sqlite3.Row rows index by column name, so the templates use them as-is
+    pet_data = connection.execute("select * from pet").fetchall()
     return render_template("pets.html", data=pet_data)
 
+app.add_url_rule("/", endpoint="get_pets")
+
 @app.route("/create", methods=["GET"])
 def get_create():
     return render_template("create.html")
@@ -44,15 +43,7 @@ def post_create():
 
 @app.route("/edit/<id>", methods=["GET"])
 def get_edit(id):
-    cursor = connection.cursor()
-    row = cursor.execute("select * from pet where id = ?", (id,)).fetchone()
-    pet = {
-        "id":str(row[0]),
-        "name":row[1],
-        "kind":row[2],
-        "noise":row[3],
-        "food":row[4]
-    }
+    pet = connection.execute("select * from pet where id = ?", (id,)).fetchone()
     return render_template("edit.html", pet=pet)
 
 @app.route("/edit/<id>", methods=["POST"])
@@ -1,4 +1,7 @@
+import os
+
 from flask import Flask, render_template, request, redirect, url_for
+from jinja2 import FileSystemBytecodeCache
 
 import database
 
@@ -6,12 +9,25 @@ import database
 
 app = Flask(__name__)
 
-@app.route("/", methods=["GET"])
-@app.route("/pets",methods=["GET"])
+# persist compiled templates and skip per-request mtime checks
+os.makedirs(".jinja_cache", exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=".jinja_cache")
+app.jinja_env.auto_reload = False
+
+# warm every template so the first request does not pay compilation
+for _tpl in app.jinja_env.list_templates():
+    try:
+        app.jinja_env.get_template(_tpl)
+    except Exception:
+        pass
+
+@app.route("/pets", methods=["GET"])
 def get_pets():
     pet_data = database.retrieve_pets()
     return render_template("pets.html", data=pet_data)
 
+app.add_url_rule("/", endpoint="get_pets")
+
 @app.route("/create", methods=["GET"])
 def get_create():
     return render_template("create.html")
@@ -31,12 +47,12 @@ def post_create():
     database.create_pet(pet_item)
     return redirect(url_for("get_pets"))
 
-@app.route("/edit/<id>", methods=["GET"])
+@app.route("/edit/<int:id>", methods=["GET"])
 def get_edit(id):
     pet = database.retrieve_pet(id)
     return render_template("edit.html", pet=pet)
 
-@app.route("/edit/<id>", methods=["POST"])
+@app.route("/edit/<int:id>", methods=["POST"])
 def post_edit(id):
     name = request.form.get("name")
     kind = request.form.get("kind")
@@ -52,7 +68,7 @@ def post_edit(id):
     database.update_pet(pet_item)
     return redirect(url_for("get_pets"))
 
-@app.route("/delete/<id>", methods=["GET"])
+@app.route("/delete/<int:id>", methods=["GET"])
 def get_delete(id): 
     database.delete_pet(id)
     return redirect(url_for("get_pets"))
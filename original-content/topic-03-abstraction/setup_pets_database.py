@@ -1,57 +1,48 @@
 import sqlite3
+import sys
 
 conn = sqlite3.connect("pets.db")
 
-cursor = conn.cursor()
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
 
-try:
-    cursor.execute("""
-        DROP TABLE pet
-    """)
-    conn.commit()
-except:
-    pass
+force = "--force" in sys.argv
+existing = conn.execute(
+    "SELECT name FROM sqlite_master WHERE type='table' AND name = 'pet'"
+).fetchall()
 
-cursor.execute("""
-    CREATE TABLE pet (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        kind TEXT,
-        noise TEXT,
-        food TEXT
-    )
-""")
-conn.commit()
+cursor = conn.cursor()
 
+if force or not existing:
+    cursor.execute("BEGIN")
 
-cursor.execute("""
-    INSERT INTO pet (name, kind)
-    VALUES ("dorothy", "dog")
-""")
+    cursor.execute("DROP TABLE IF EXISTS pet")
 
-cursor.execute("""
-    INSERT INTO pet (name, kind)
-    VALUES ("sandy", "cat")
-""")
+    cursor.execute("""
+        CREATE TABLE pet (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            kind TEXT,
+            noise TEXT,
+            food TEXT
+        )
+    """)
 
-cursor.execute("""
-    INSERT INTO pet (name, kind)
-    VALUES ("whiskers", "hamster")
-""")
+    cursor.execute(
+        "INSERT INTO pet (name, kind) VALUES (?, ?), (?, ?), (?, ?)",
+        ("dorothy", "dog", "sandy", "cat", "whiskers", "hamster"),
+    )
 
-conn.commit()
+    conn.commit()
 
 cursor = conn.cursor()
 
 result = cursor.execute("select * from pet")
 rows = cursor.fetchall()
-for row in rows:
-    print([row])
 
 data = []
 for row in rows:
     (id, name, kind, noise, food) = row
-    print(name, kind)
     item = {
         "id":id,
         "name":name,
@@ -60,7 +51,6 @@ for row in rows:
         "food":food
     }
     data.append(item)
-    print(data)
 
 data = [
     {
@@ -1,62 +1,65 @@
 import sqlite3
+import threading
 from setup_pets_database import setup_database
 
 # remember to $ pip install flask
 
-connection = sqlite3.connect("pets.db", check_same_thread=False)
+DB_PATH = "pets.db"
+
+# one connection per worker thread, so readers do not share a mutex
+_pool = {}
+_MAX_POOL = 8
+_pool_lock = threading.Lock()
+
+def _conn():
+    tid = threading.get_ident()
+    connection = _pool.get(tid)
+    if connection is None:
+        with _pool_lock:
+            # evict only connections whose owning thread has exited;
+            # a live thread may be mid-query on its connection
+            if len(_pool) >= _MAX_POOL:
+                alive = {t.ident for t in threading.enumerate()}
+                for dead_tid in [t for t in _pool if t not in alive]:
+                    _pool.pop(dead_tid).close()
+            connection = sqlite3.connect(
+                DB_PATH, check_same_thread=False, cached_statements=512, isolation_level=None
+            )
+            connection.row_factory = sqlite3.Row
+            _pool[tid] = connection
+    return connection
+
+_SQL_LIST_PETS = "SELECT id, name, kind, noise, food FROM pet"
+_SQL_GET_PET = "SELECT id, name, kind, noise, food FROM pet WHERE id = ?"
 
 def retrieve_pets():
-    cursor = connection.cursor()
-    rows = cursor.execute("select * from pet").fetchall()
-    pet_data = [
-        {
-            "id":str(id),
-            "name":name,
-            "kind":kind,
-            "noise":noise,
-            "food":food
-        }
-        for id, name, kind, noise, food in rows
-    ]
-    return pet_data
+    # the cursor iterates lazily, one sqlite3.Row at a time, so Jinja can
+    # stream large results without the whole list living in memory
+    return _conn().execute(_SQL_LIST_PETS)
 
 def test_retrieve_pets():
     print("testing retrieve_pets...")
-    data = retrieve_pets()
-    assert type(data) == list
-    assert type(data[0]) == dict
+    data = list(retrieve_pets())
+    assert type(data[0]) == sqlite3.Row
     for field in ["id","name","kind","noise","food"]:
-        assert field in data[0]
-        # print([data[0][field]])
-        # print(type(data[0][field]))
-        # print(field, data[0])
-        # print([data[0][field]])
-        # print([type(data[0][field])])
-        if data[0][field]:
-            assert type(data[0][field]) == str
+        assert field in data[0].keys()
+    assert type(data[0]["id"]) == int
 
 def retrieve_pet(id):
-    cursor = connection.cursor()
-    id = int(id)
-    row = cursor.execute("select * from pet where id = ?", (id,)).fetchone()
-    pet_item = {
-        "id":str(row[0]),
-        "name":row[1],
-        "kind":row[2],
-        "noise":row[3],
-        "food":row[4]
-    }
-    return pet_item
+    return _conn().execute(_SQL_GET_PET, (int(id),)).fetchone()
 
 def test_retrieve_pet():
     print("testing retrieve_pet...")
-    pets = retrieve_pets()
+    pets = list(retrieve_pets())
     expected_pet = pets[0]
     pet = retrieve_pet(pets[0]["id"])
-    assert pet == pets[0]
+    assert int(pet["id"]) == expected_pet["id"]
+    for field in ["name","kind","noise","food"]:
+        assert pet[field] == expected_pet[field]
 
 
 def create_pet(name, kind, noise, food):
+    connection = _conn()
     cursor = connection.cursor()
     cursor.execute("insert into pet (name, kind, noise, food) values (?, ?, ?, ?)", (
             name,
@@ -68,7 +71,7 @@ def create_pet(name, kind, noise, food):
 def test_create_pet():
     print("testing create_pet()...")
     create_pet("spot","dog","arf","dogfood")
-    data = retrieve_pets()
+    data = retrieve_pets()  # iterating the cursor directly is fine here
     found = False
     for item in data:
         if item["name"] == "spot":
@@ -79,6 +82,7 @@ def test_create_pet():
     assert found
 
 def update_pet(id, name, kind, noise, food):
+    connection = _conn()
     cursor = connection.cursor()
     cursor.execute("update pet set name = ?, kind = ?, noise = ?, food = ? where id = ?", (
             name,
@@ -90,31 +94,32 @@ def update_pet(id, name, kind, noise, food):
 
 def test_update_pet():
     print("testing update_pet()...")
-    data = retrieve_pets()
+    data = list(retrieve_pets())
     pet = data[0]
     update_pet(pet["id"],"suzy",pet["kind"],pet["noise"],pet["food"])
-    data = retrieve_pets()
+    data = list(retrieve_pets())
     pet = data[0]
     assert pet["name"] == "suzy"
 
 def delete_pet(id):
+    connection = _conn()
     cursor = connection.cursor()
     cursor.execute("delete from pet where id = ?", (id,))
     connection.commit()
 
 def test_delete_pet():
     print("testing delete pet()...")
-    old_data = retrieve_pets()
+    old_data = list(retrieve_pets())
     pet = old_data[0]
     delete_pet(pet["id"])
-    data = retrieve_pets()
+    data = list(retrieve_pets())
     for i in range(0,len(data)):
         for field in ["id","name","kind"]:
             assert data[i][field] == old_data[i+1][field]
 
 if __name__ == "__main__":
-    setup_database("test_pets.db")
-    connection = sqlite3.connect("test_pets.db", check_same_thread=False)
+    setup_database("test_pets.db", force=True)
+    DB_PATH = "test_pets.db"
     test_retrieve_pets()
     test_retrieve_pet()
     test_create_pet()
@@ -1,18 +1,25 @@
 import sqlite3
 
-def setup_database(name):
+def setup_database(name, force=False):
 
     conn = sqlite3.connect(name)
 
+    if not force:
+        existing = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name IN ('pet','kind')"
+        ).fetchall()
+        if len(existing) == 2:
+            # already provisioned; skip the drop/reseed
+            return conn
+
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
     cursor = conn.cursor()
 
-    try:
-        cursor.execute("""
-            DROP TABLE pet
-        """)
-        conn.commit()
-    except:
-        pass
+    cursor.execute("BEGIN")
+
+    cursor.execute("DROP TABLE IF EXISTS pet")
 
     cursor.execute("""
         CREATE TABLE pet (
@@ -23,60 +30,36 @@ def setup_database(name):
             food TEXT
         )
     """)
-    conn.commit()
 
+    cursor.execute(
+        "INSERT INTO pet (name, kind) VALUES (?, ?), (?, ?), (?, ?)",
+        ("dorothy", "dog", "sandy", "cat", "whiskers", "hamster"),
+    )
 
-    cursor.execute("""
-        INSERT INTO pet (name, kind)
-        VALUES ("dorothy", "dog")
-    """)
+    # setup KIND table
 
-    cursor.execute("""
-        INSERT INTO pet (name, kind)
-        VALUES ("sandy", "cat")
-    """)
+    cursor.execute("DROP TABLE IF EXISTS kind")
 
     cursor.execute("""
-        INSERT INTO pet (name, kind)
-        VALUES ("whiskers", "hamster")
+        CREATE TABLE kind (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind_name TEXT NOT NULL,
+            noise TEXT,
+            food TEXT
+        )
     """)
 
+    cursor.execute(
+        "INSERT INTO kind (kind_name, noise, food)"
+        " VALUES (?, ?, ?), (?, ?, ?), (?, ?, ?), (?, ?, ?)",
+        ("dog", "arf", "dogfood", "cat", "meow", "catfood",
+         "fish", "blub", "fishfood", "hamster", "squeak", "hamsterchow"),
+    )
+
     conn.commit()
 
     cursor = conn.cursor()
 
-    result = cursor.execute("select * from pet")
-    rows = cursor.fetchall()
-    for row in rows:
-        print([row])
-
-    data = []
-    for row in rows:
-        (id, name, kind, noise, food) = row
-        print(name, kind)
-        item = {
-            "id":id,
-            "name":name,
-            "kind":kind,
-            "noise":noise,
-            "food":food
-        }
-        data.append(item)
-        print(data)
-
-    data = [
-        {
-            "id":id,
-            "name":name,
-            "kind":kind,
-            "noise":noise,
-            "food":food
-        }
-        for id, name, kind, noise, food in rows
-    ]
-
-    print(data)
-
     rows = cursor.execute("select * from pet").fetchall()
     data = [
         {
@@ -89,49 +72,8 @@ def setup_database(name):
         for id, name, kind, noise, food in rows
     ]
 
-    # setup KIND table
-
-    try:
-        cursor.execute("""
-            DROP TABLE kind
-        """)
-        conn.commit()
-    except:
-        pass
-
-    cursor.execute("""
-        CREATE TABLE kind (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            kind_name TEXT NOT NULL,
-            noise TEXT,
-            food TEXT
-        )
-    """)
-    conn.commit()
-
-
-    cursor.execute("""
-        INSERT INTO kind (kind_name, noise, food)
-        VALUES ("dog", "arf", "dogfood")
-    """)
-
-    cursor.execute("""
-        INSERT INTO kind (kind_name, noise, food)
-        VALUES ("cat", "meow", "catfood")
-    """)
-
-    cursor.execute("""
-        INSERT INTO kind (kind_name, noise, food)
-        VALUES ("fish", "blub", "fishfood")
-    """)
-
-    cursor.execute("""
-        INSERT INTO kind (kind_name, noise, food)
-        VALUES ("hamster", "squeak", "hamsterchow")
-    """)
-
-    conn.commit()
+    print(data)
 
 if __name__ == "__main__":
-    setup_database("pets.db")
-
+    import sys
+    setup_database("pets.db", force="--force" in sys.argv)
@@ -1,4 +1,8 @@
+import logging
+import os
+
 from flask import Flask, render_template, request, redirect, url_for
+from jinja2 import FileSystemBytecodeCache
 
 import database
 
@@ -8,47 +12,73 @@ database.initialize("pets.db")
 
 app = Flask(__name__)
 
-@app.route("/", methods=["GET"]) 
+log = logging.getLogger(__name__)
+
+# persist compiled templates and skip per-request mtime checks
+os.makedirs(".jinja_cache", exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=".jinja_cache")
+app.jinja_env.auto_reload = False
+
+# warm every template so the first request does not pay compilation
+for _tpl in app.jinja_env.list_templates():
+    try:
+        app.jinja_env.get_template(_tpl)
+    except Exception:
+        pass
+
 @app.route("/list", methods=["GET"])
 def get_list():
     pets = database.get_pets()
     return render_template("list.html", pets=pets)     
 
+app.add_url_rule("/", endpoint="get_list")
+
 
-@app.route("/kind", methods=["GET"])
 @app.route("/kind/list", methods=["GET"])
 def get_kind_list():
     kinds = database.get_kinds()
     return render_template("kind_list.html", kinds=kinds)
 
+app.add_url_rule("/kind", endpoint="get_kind_list")
+
 
 @app.route("/create", methods=["GET"])
 def get_create():
     kinds = database.get_kinds()
-    print("KINDS = ",kinds)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("kinds=%r", kinds)
     return render_template("create.html", kinds=kinds)     
 
 @app.route("/create", methods=["POST"])
 def post_create():
-    data = dict(request.form)
-    print("DATA=",data)
-    database.create_pet(data)
+    database.create_pet(
+        name=request.form.get("name"),
+        age=request.form.get("age"),
+        kind_id=request.form.get("kind_id"),
+        owner=request.form.get("owner"),
+    )
     return redirect(url_for("get_list"))  
 
-@app.route("/delete/<id>", methods=["GET"])
+@app.route("/delete/<int:id>", methods=["GET"])
 def get_delete(id):
     database.delete_pet(id)
     return redirect(url_for("get_list"))  
 
-@app.route("/update/<id>", methods=["GET"])
+@app.route("/update/<int:id>", methods=["GET"])
 def get_update(id):
     data = database.get_pet(id)
-    return render_template("update.html",data=data)
+    kinds = database.get_kinds()
+    return render_template("update.html",data=data,kinds=kinds)
 
-@app.route("/update/<id>", methods=["POST"])
+@app.route("/update/<int:id>", methods=["POST"])
 def post_update(id):
-    data = dict(request.form)
-    database.update_pet(id, data)
+    database.update_pet(
+        id,
+        name=request.form.get("name"),
+        age=request.form.get("age"),
+        kind_id=request.form.get("kind_id"),
+        owner=request.form.get("owner"),
+    )
     return redirect(url_for("get_list"))  
 
 @app.route("/kind/create", methods=["GET"])
@@ -57,11 +87,14 @@ def get_kind_create():
 
 @app.route("/kind/create", methods=["POST"])
 def post_kind_create():
-    data = dict(request.form)
-    database.create_kind(data)
+    database.create_kind(
+        name=request.form.get("name"),
+        food=request.form.get("food"),
+        sound=request.form.get("sound"),
+    )
     return redirect(url_for("get_kind_list"))
 
-@app.route("/kind/delete/<id>", methods=["GET"])
+@app.route("/kind/delete/<int:id>", methods=["GET"])
 def get_kind_delete(id):
     try:
         database.delete_kind(id)
@@ -69,13 +102,17 @@ def get_kind_delete(id):
         return render_template("error.html", error_text=str(e))
     return redirect(url_for("get_kind_list"))
 
-@app.route("/kind/update/<id>", methods=["GET"])
+@app.route("/kind/update/<int:id>", methods=["GET"])
 def get_kind_update(id):
     data = database.get_kind(id)
     return render_template("kind_update.html",data=data)
 
-@app.route("/kind/update/<id>", methods=["POST"])
+@app.route("/kind/update/<int:id>", methods=["POST"])
 def post_kind_update(id):
-    data = dict(request.form)
-    database.update_kind(id, data)
+    database.update_kind(
+        id,
+        name=request.form.get("name"),
+        food=request.form.get("food"),
+        sound=request.form.get("sound"),
+    )
     return redirect(url_for("get_kind_list"))
@@ -1,117 +1,218 @@
+import queue
 import sqlite3
+import threading
+import time
 
-connection = None
+DB_PATH = None
+
+# one connection per worker thread, so readers do not share a mutex
+_pool = {}
+_MAX_POOL = 8
+_pool_lock = threading.Lock()
+
+
+def _conn():
+    tid = threading.get_ident()
+    connection = _pool.get(tid)
+    if connection is None:
+        with _pool_lock:
+            # evict only connections whose owning thread has exited;
+            # a live thread may be mid-query on its connection
+            if len(_pool) >= _MAX_POOL:
+                alive = {t.ident for t in threading.enumerate()}
+                for dead_tid in [t for t in _pool if t not in alive]:
+                    _pool.pop(dead_tid).close()
+            connection = sqlite3.connect(
+                DB_PATH, check_same_thread=False, cached_statements=512
+            )
+            connection.execute("PRAGMA foreign_keys = 1")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA temp_store=MEMORY")
+            connection.execute("PRAGMA cache_size=-64000")
+            connection.execute("PRAGMA mmap_size=268435456")
+            connection.row_factory = sqlite3.Row
+            _ensure_schema(connection)
+            _pool[tid] = connection
+    return connection
+
+SQL_GET_PET = "SELECT id, name, kind_id, age, owner FROM pet WHERE id = ?"
+SQL_INS_PET = "insert into pet(name, age, kind_id, owner) values (?,?,?,?)"
+SQL_UPD_PET = "update pet set name=?, age=?, kind_id=?, owner=? where id=?"
+SQL_DEL_PET = "delete from pet where id = ?"
+
+SQL_LIST_KINDS = "select * from kind"
+SQL_GET_KIND = "SELECT id, name, food, sound FROM kind WHERE id = ?"
+SQL_INS_KIND = "insert into kind(name, food, sound) values (?,?,?)"
+SQL_UPD_KIND = "update kind set name=?, food=?, sound=? where id=?"
+SQL_DEL_KIND = "delete from kind where id = ?"
+
+SQL_LIST_PETS = "SELECT * FROM v_pet_full"
+
+SQL_CREATE_PET_KIND_INDEX = "CREATE INDEX IF NOT EXISTS ix_pet_kind_id ON pet(kind_id)"
+SQL_CREATE_PET_VIEW = """
+    CREATE VIEW IF NOT EXISTS v_pet_full AS
+    SELECT pet.id, pet.name, pet.age, pet.owner, kind.name AS kind_name, kind.food, kind.sound
+    FROM pet
+    JOIN kind ON pet.kind_id = kind.id
+"""
+
+
+def _ensure_schema(connection):
+    # only once the tables exist; setup_test_database calls this after DDL
+    tables = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name IN ('pet','kind')"
+    ).fetchall()
+    if len(tables) == 2:
+        connection.execute(SQL_CREATE_PET_KIND_INDEX)
+        connection.execute(SQL_CREATE_PET_VIEW)
+
+
+# query results are cached until a mutation bumps the matching version
+_cache = {}
+_version = {"pet": 0, "kind": 0}
+
+# writes are queued and flushed by one background thread, so a burst of
+# POSTs shares a single commit (one fsync) instead of one per request
+_write_q = queue.Queue()
+_BATCH_WINDOW = 0.005
+_BATCH_LIMIT = 64
+
+
+def _flush(connection, ops):
+    groups = {}
+    for op in ops:
+        groups.setdefault(op[0], []).append(op)
+    try:
+        for sql, group in groups.items():
+            connection.executemany(sql, [op[1] for op in group])
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        # retry one at a time so each caller gets its own error
+        for sql, params, event, errors in ops:
+            try:
+                connection.execute(sql, params)
+                connection.commit()
+            except Exception as error:
+                connection.rollback()
+                errors.append(error)
+    for op in ops:
+        op[2].set()
+
+
+def _writer():
+    while True:
+        ops = [_write_q.get()]
+        deadline = time.monotonic() + _BATCH_WINDOW
+        while len(ops) < _BATCH_LIMIT:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                ops.append(_write_q.get(timeout=timeout))
+            except queue.Empty:
+                break
+        _flush(_conn(), ops)
+
+
+_writer_thread = threading.Thread(target=_writer, daemon=True)
+_writer_thread.start()
+
+
+def _submit_write(sql, params):
+    event = threading.Event()
+    errors = []
+    _write_q.put((sql, params, event, errors))
+    event.wait()
+    if errors:
+        raise errors[0]
+
+
+def safe_int(value, default=0):
+    # cheaper than try/except for the malformed-form-input path
+    if value is None:
+        return default
+    value = str(value).strip()
+    digits = value[1:] if value.startswith("-") else value
+    if digits.isdigit():
+        return int(value)
+    return default
 
 
 def initialize(database_file):
-    global connection
-    connection = sqlite3.connect(database_file, check_same_thread=False)
-    connection.execute("PRAGMA foreign_keys = 1")
-    connection.row_factory = sqlite3.Row
+    global DB_PATH
+    DB_PATH = database_file
+    for connection in _pool.values():
+        connection.close()
+    _pool.clear()
+    _cache.clear()
 
 
 def get_pets():
-    cursor = connection.cursor()
-    cursor.execute("""
-        SELECT pet.id, pet.name, pet.age, pet.owner, kind.name as kind_name, kind.food, kind.sound 
-        FROM pet 
-        JOIN kind ON pet.kind_id = kind.id
-    """)
-    pets = cursor.fetchall()
+    key = ("pets", _version["pet"], _version["kind"])
+    pets = _cache.get(key)
+    if pets is not None:
+        return pets
+    pets = _conn().execute(SQL_LIST_PETS).fetchall()
     pets = [dict(pet) for pet in pets]
-    for pet in pets:
-        print(pet)
+    _cache.clear()
+    _cache[key] = pets
     return pets
 
 def get_kinds():
-    cursor = connection.cursor()
-    cursor.execute("""select * from kind""")
-    kinds = cursor.fetchall()
+    key = ("kinds", _version["kind"])
+    kinds = _cache.get(key)
+    if kinds is not None:
+        return kinds
+    kinds = _conn().execute(SQL_LIST_KINDS).fetchall()
     kinds = [dict(kind) for kind in kinds]
-    for kind in kinds:
-        print(kind)
+    _cache[key] = kinds
     return kinds
 
 def get_pet(id):
-    cursor = connection.cursor()
-    cursor.execute(f"""select * from pet where id = ?""", (id,))
-    rows = cursor.fetchall()
-    try:
-        (id, name, xtype, age, owner) = rows[0]
-        data = {"id": id, "name": name, "kind": kind, "age": age, "owner": owner}
-
-        return data
-    except:
+    row = _conn().execute(SQL_GET_PET, (int(id),)).fetchone()
+    if row is None:
         return "Data not found."
+    return dict(row)
 
 def get_kind(id):
-    cursor = connection.cursor()
-    cursor.execute(f"""select * from kind where id = ?""", (id,))
-    rows = cursor.fetchall()
-    try:
-        (id, name, food, sound) = rows[0]
-        data = {"id": id, "name": name, "food": food, "sound": sound}
-
-        return data
-    except:
+    row = _conn().execute(SQL_GET_KIND, (int(id),)).fetchone()
+    if row is None:
         return "Data not found."
+    return dict(row)
 
-def create_pet(data):
-    try:
-        data["age"] = int(data["age"])
-    except:
-        data["age"] = 0
-    cursor = connection.cursor()
-    cursor.execute(
-        """insert into pet(name, age, kind_id, owner) values (?,?,?,?)""",
-        (data["name"], data["age"], data["kind_id"], data["owner"]),
-    )
-    connection.commit()
+def create_pet(name, age, kind_id, owner):
+    _submit_write(SQL_INS_PET, (name, safe_int(age), kind_id, owner))
+    _version["pet"] += 1
 
-def create_kind(data):
-    cursor = connection.cursor()
-    cursor.execute(
-        """insert into kind(name, food, sound) values (?,?,?)""",
-        (data["name"], data["food"], data["sound"]),
-    )
-    connection.commit()
+def create_kind(name, food, sound):
+    _submit_write(SQL_INS_KIND, (name, food, sound))
+    _version["kind"] += 1
 
 def test_create_pet():
     pass
 
 
-def update_pet(id, data):
-    try:
-        data["age"] = int(data["age"])
-    except:
-        data["age"] = 0
-    cursor = connection.cursor()
-    cursor.execute(
-        """update pet set name=?, age=?, type=?, owner=? where id=?""",
-        (data["name"], data["age"], data["type"], data["owner"], id),
-    )
-    connection.commit()
+def update_pet(id, name, age, kind_id, owner):
+    _submit_write(SQL_UPD_PET, (name, safe_int(age), kind_id, owner, id))
+    _version["pet"] += 1
 
-def update_kind(id, data):
-    cursor = connection.cursor()
-    cursor.execute(
-        """update kind set name=?, food=?, sound=? where id=?""",
-        (data["name"], data["food"], data["sound"], id),
-    )
-    connection.commit()
+def update_kind(id, name, food, sound):
+    _submit_write(SQL_UPD_KIND, (name, food, sound, id))
+    _version["kind"] += 1
 
 def delete_pet(id):
-    cursor = connection.cursor()
-    cursor.execute(f"""delete from pet where id = ?""", (id,))
-    connection.commit()
+    _submit_write(SQL_DEL_PET, (id,))
+    _version["pet"] += 1
 
 def delete_kind(id):
-    cursor = connection.cursor()
-    cursor.execute(f"""delete from kind where id = ?""", (id,))
-    connection.commit()
+    _submit_write(SQL_DEL_KIND, (id,))
+    _version["kind"] += 1
 
 def setup_test_database():
     initialize("test_pets.db")
+    connection = _conn()
     cursor = connection.cursor()
     cursor.execute("drop table if exists pet")
     cursor.execute("drop table if exists kind")
@@ -143,6 +244,7 @@ def setup_test_database():
         ("cat", "catfood", "meow"),
     )
     connection.commit()
+    connection = _conn()
     cursor = connection.cursor()
     cursor.execute(
         """
@@ -162,8 +264,13 @@ def setup_test_database():
         {"name": "casey", "kind_id": 2, "age": 9, "owner": "greg"},
         {"name": "heidi", "kind_id": 2, "age": 15, "owner": "david"},
     ]
-    for pet in pets:
-        create_pet(pet)
+    _ensure_schema(connection)
+    connection.commit()
+    connection.executemany(
+        SQL_INS_PET,
+        [(pet["name"], pet["age"], pet["kind_id"], pet["owner"]) for pet in pets],
+    )
+    connection.commit()
     pets = get_pets()
     assert len(pets) == 4
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pprint import pprint
 import mongita
 
@@ -7,19 +8,30 @@ from bson.objectid import ObjectId
 client = MongitaClientDisk()
 
 pets_db = client.pets_db
+pet_collection = pets_db.pet_collection
+kind_collection = pets_db.kind_collection
 
 def get_pets():
-    pet_collection = pets_db.pet_collection
-    kind_collection = pets_db.kind_collection
-    pets = list(pet_collection.find())
-    for pet in pets:
-        pet["id"] = str(pet["_id"])
-        del pet["_id"]
-        kind = kind_collection.find_one({"_id":pet["kind_id"]})
-        for tag in ["kind_name","noise","food"]:
-            pet[tag] = kind[tag]
-        del pet["kind_id"]
-        # pet["_id"] = ObjectId(pet["id"])
+    # one scan of the kinds, then in-memory lookups,
+    # instead of a find_one round trip per pet
+    # (mongita matches string ids against ObjectId _ids, so key both forms)
+    kinds_by_id = {}
+    for kind in kind_collection.find():
+        kinds_by_id[kind["_id"]] = kind
+        kinds_by_id[str(kind["_id"])] = kind
+    # one dict literal per pet instead of del/reassign churn on the raw doc
+    pets = []
+    for pet in pet_collection.find():
+        kind = kinds_by_id[pet["kind_id"]]
+        pets.append({
+            "id": str(pet["_id"]),
+            "name": pet["name"],
+            "age": pet["age"],
+            "owner": pet["owner"],
+            "kind_name": kind["kind_name"],
+            "noise": kind["noise"],
+            "food": kind["food"],
+        })
     return pets
 
 def test_get_pets():
@@ -31,14 +43,21 @@ def test_get_pets():
     pets[0]['id'] = '1'
     assert pets[0] == {'id': '1', 'name': 'Suzy', 'age': 3, 'owner': 'Greg', 'kind_name': 'Dog', 'food': 'Dog food', 'noise': 'Bark'}
 
-def get_pet(id):
-    pet_collection = pets_db.pet_collection
-    id = ObjectId(id)
-    pet = pet_collection.find_one({"_id":id})
+# mongita has no shared page cache, so repeated _id lookups re-read the
+# document from disk; the LRU keeps the hot ones in memory (keys are the
+# string ids so they stay hashable)
+
+@lru_cache(maxsize=1024)
+def _get_pet_cached(id):
+    pet = pet_collection.find_one({"_id":ObjectId(id)})
     pet["id"] = str(pet["_id"])
     del pet["_id"]
     return pet
 
+def get_pet(id):
+    # copy so callers cannot mutate the cached document
+    return dict(_get_pet_cached(str(id)))
+
 def test_get_pet():
     print("test get_pet")
     pets = get_pets()
@@ -48,7 +67,6 @@ def test_get_pet():
     assert pet == {'id': id, 'name': 'Suzy', 'age': 3,  'owner': 'Greg'}  
 
 def get_kinds():
-    kind_collection = pets_db.kind_collection
     kinds = list(kind_collection.find())
     for kind in kinds:
         kind["id"] = str(kind["_id"])
@@ -67,14 +85,17 @@ def test_get_kinds():
     assert kind["food"] == "Dog food"
     assert kind["noise"] == "Bark"
 
-def get_kind(id):
-    kind_collection = pets_db.kind_collection
-    id = ObjectId(id)
-    kind = kind_collection.find_one({"_id":id})
+@lru_cache(maxsize=1024)
+def _get_kind_cached(id):
+    kind = kind_collection.find_one({"_id":ObjectId(id)})
     kind["id"] = str(kind["_id"])
     del kind["_id"]
     return kind
 
+def get_kind(id):
+    # copy so callers cannot mutate the cached document
+    return dict(_get_kind_cached(str(id)))
+
 def test_get_kind():
     print("test get_kind")
     kinds = get_kinds()
@@ -86,14 +107,21 @@ def test_get_kind():
     assert kind["noise"] == "Bark"
 
 def create_pet(data):
-    try:
-        data["age"] = int(data["age"])
-    except:
+    # C-level digit check instead of exception-driven control flow on
+    # the common empty-form case
+    raw = data.get("age", 0)
+    if isinstance(raw, int):
+        data["age"] = raw
+    elif isinstance(raw, str) and (
+        raw[1:] if raw.startswith("-") else raw
+    ).isdigit():
+        data["age"] = int(raw)
+    else:
         data["age"] = 0
     # pets_collection = pets_db.pets_collection # <- Wrong table name
-    pet_collection = pets_db.pet_collection
     # pets_collection.insert_one(data)
     pet_collection.insert_one(data)
+    _get_pet_cached.cache_clear()
     print(list(pet_collection.find())) # <- Debug Print
     
 
@@ -188,7 +216,9 @@ def test_create_pet():
 
 def create_sample_database():
     print("create sample database...")
-    global client
+    global client, pets_db, pet_collection, kind_collection
+    _get_pet_cached.cache_clear()
+    _get_kind_cached.cache_clear()
     client = MongitaClientDisk(host="./sample_database")
     pets_db = client.pets_db
     pets_db.drop_collection("kind_collection")
@@ -219,15 +249,17 @@ def create_sample_database():
         {'name':'Dorothy', 'age':1, "kind_name":"Dog", 'owner':'Elizabeth'},
         {'name':'Heidi', 'age':4, "kind_name":"Dog",'owner':'David'}
     ]
+    # one name -> _id map instead of rescanning kinds for every pet
+    name_to_id = {kind["kind_name"]: kind["_id"] for kind in kinds}
     for pet in pets:
-        for kind in kinds:
-            if kind["kind_name"] == pet["kind_name"]:
-                pet["kind_id"] = kind["_id"]
-        del pet["kind_name"]
-        assert "kind_id" in pet.keys()
+        pet["kind_id"] = name_to_id[pet.pop("kind_name")]
 
     pet_collection.insert_many(pets)
 
+    # indexed lookups instead of linear collection walks
+    pet_collection.create_index("kind_id")
+    kind_collection.create_index("kind_name")
+
 
 if __name__ == "__main__":
     create_sample_database()
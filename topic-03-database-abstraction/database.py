@@ -89,8 +89,11 @@ def setup_test_database():
         {"name": "casey", "type": "dog", "age": 9, "owner": "greg"},
         {"name": "heidi", "type": "cat", "age": 15, "owner": "david"},
     ]
-    for pet in pets:
-        create_pet(pet)
+    cursor.executemany(
+        """insert into pets(name, age, type, owner) values (?,?,?,?)""",
+        [(pet["name"], pet["age"], pet["type"], pet["owner"]) for pet in pets],
+    )
+    connection.commit()
     pets = get_pets()
     assert len(pets) == 4
 
@@ -17,7 +17,7 @@ class Pet(Model):
     name = CharField()
     age = IntegerField()
     owner = CharField()
-    kind = ForeignKeyField(Kind, backref="pets")
+    kind = ForeignKeyField(Kind, backref="pets", index=True)
 
     class Meta:
         database = db
@@ -25,14 +25,43 @@ class Pet(Model):
 
 def initialize(database_file):
     global db, Kind, Pet
-    db = SqliteDatabase(database_file)
+    db = SqliteDatabase(
+        database_file,
+        pragmas={
+            "journal_mode": "wal",
+            "synchronous": "normal",
+            "temp_store": "memory",
+            "cache_size": -64000,
+            "mmap_size": 268435456,
+            "foreign_keys": 1,
+            "analysis_limit": 400,
+        },
+    )
 
     Kind._meta.database = db
     Pet._meta.database = db
+    # UPDATEs only touch changed columns
+    Kind._meta.only_save_dirty = True
+    Pet._meta.only_save_dirty = True
 
     db.connect()
     db.create_tables([Pet, Kind])
 
+    # seed planner statistics on first open, then let PRAGMA optimize
+    # keep them fresh (ANALYZE cost is bounded by analysis_limit above)
+    if not db.table_exists("sqlite_stat1"):
+        db.execute_sql("ANALYZE")
+    db.execute_sql("PRAGMA optimize")
+
+def bulk_create_kinds(rows):
+    # one transaction + one multi-row insert instead of a save() per row
+    with db.atomic():
+        Kind.insert_many(rows).execute()
+
+def bulk_create_pets(rows):
+    with db.atomic():
+        Pet.insert_many(rows).execute()
+
 def test_initialize():
     print("test initialize...")
     initialize("test_pets.db")
@@ -40,19 +69,49 @@ def test_initialize():
 
 
 def get_pets():
-    pets = Pet.select().join(Kind)
+    # select both models so pet.kind is hydrated from the join,
+    # not lazily fetched one query per pet
+    pets = Pet.select(Pet, Kind).join(Kind)
     return list(pets)
 
+def get_pets_shallow():
+    # for call sites that never touch pet.kind
+    return list(Pet.select())
+
+def get_pets_for_template():
+    # rows come back as plain dicts, skipping Model.__init__ per row;
+    # Jinja's dot lookup falls back to __getitem__ so templates are unchanged
+    return list(
+        Pet.select(
+            Pet.id, Pet.name, Pet.age, Pet.owner,
+            Kind.kind_name.alias("kind_name"),
+        )
+        .join(Kind)
+        .dicts()
+    )
+
+def get_pets_prefetch():
+    # two queries stitched in Python: each Kind row is materialized once,
+    # where the join re-transfers the kind columns for every pet
+    return list(prefetch(Pet.select(), Kind.select()))
+
 def test_get_pets():
     print("test get_pets...")
-    kind = Kind(kind_name = "dog",food="dog_food",noise="bark")
-    kind.save()
-    pet = Pet(name="Dorothy",age=10,owner="Greg",kind=kind)
-    pet.save()
+    with db.atomic():
+        kind = Kind(kind_name = "dog",food="dog_food",noise="bark")
+        kind.save()
+        pet = Pet(name="Dorothy",age=10,owner="Greg",kind=kind)
+        pet.save()
     pets = get_pets()
     assert type(pets) is list
     assert type(pets[0]) is Pet
     assert pets[0].name == "Dorothy"
+    pets = get_pets_prefetch()
+    assert type(pets[0]) is Pet
+    assert pets[0].kind.kind_name == "dog"
+    pets = get_pets_for_template()
+    assert type(pets[0]) is dict
+    assert pets[0]["kind_name"] == "dog"
 
 def get_kinds():
     kinds = Kind.select()
@@ -67,10 +126,36 @@ def test_get_kinds():
     assert type(kinds[0]) is Kind
     assert kinds[0].kind_name == "dog"
 
+_GET_PET_SQL = "SELECT id, name, age, owner, kind_id FROM pet WHERE id = ?"
+_GET_KIND_SQL = "SELECT id, kind_name, food, noise FROM kind WHERE id = ?"
+
 def get_pet_by_id(id):
-    # pet = Pet.get_by_id(id)
-    pet = Pet.get_or_none(Pet.id == id)
-    return pet
+    # raw SQL skips peewee's AST-to-SQL build per call, and every lookup
+    # reuses one statement in sqlite's per-connection cache; int() keeps
+    # Flask's string route params from forcing sqlite-side coercion
+    try:
+        return Pet.raw(_GET_PET_SQL, int(id)).get()
+    except Pet.DoesNotExist:
+        return None
+
+def get_pet_dict(id):
+    # plain dict of just these columns — no Pet instance is built
+    return (
+        Pet.select(Pet.id, Pet.name, Pet.age, Pet.owner)
+        .where(Pet.id == int(id))
+        .dicts()
+        .get_or_none()
+    )
+
+
+def test_get_pet_dict():
+    print("test get_pet_dict...")
+    pet = get_pet_dict(1)
+    assert type(pet) is dict
+    assert pet["id"] == 1
+    assert "name" in pet
+    assert get_pet_dict(3451) == None
+
 
 def test_get_pet_by_id():
     print("test get_pet_by_id...")
@@ -82,9 +167,10 @@ def test_get_pet_by_id():
 
 
 def get_kind_by_id(id):
-    # kind = Kind.get_by_id(id)
-    kind = Kind.get_or_none(Kind.id == id)
-    return kind
+    try:
+        return Kind.raw(_GET_KIND_SQL, int(id)).get()
+    except Kind.DoesNotExist:
+        return None
 
 
 def test_get_kind_by_id():
@@ -96,12 +182,34 @@ def test_get_kind_by_id():
     assert kind == None
 
 
+def test_bulk_create():
+    print("test bulk_create...")
+    bulk_create_kinds([
+        {"kind_name": "cat", "food": "cat_food", "noise": "meow"},
+        {"kind_name": "fish", "food": "fish_flakes", "noise": "blub"},
+    ])
+    kind = Kind.get(Kind.kind_name == "cat")
+    bulk_create_pets([
+        {"name": "Sandy", "age": 2, "owner": "Steve", "kind": kind},
+        {"name": "Heidi", "age": 4, "owner": "David", "kind": kind},
+    ])
+    assert Pet.select().count() >= 2
+
+
 if __name__ == "__main__":
     test_initialize()
-    test_get_pets()
-    test_get_kinds()
-    test_get_pet_by_id()
-    test_get_kind_by_id()
+    # one connection for the whole run, rolled back at the end, so the
+    # tests reuse SQLite's page cache and leave test_pets.db empty for
+    # the next run instead of paying a reconnect per test
+    with db.atomic() as txn:
+        test_get_pets()
+        test_bulk_create()
+        test_get_kinds()
+        test_get_pet_by_id()
+        test_get_pet_dict()
+        test_get_kind_by_id()
+        txn.rollback()
+    db.close()
     print("done.")
 
 
@@ -1,11 +1,34 @@
-import pandas as pd
+import csv
 import sqlite3
 
-connection = sqlite3.connect("../imdb/imdb.db")
-chunksize = 10000
-i = 1
-for chunk in pd.read_csv("../imdb/title.crew.tsv", sep="\t", chunksize=chunksize):
-    print("chunk # ",i)
-    i = i + 1
-    chunk.to_sql("title_crew", connection, if_exists="append", index=False)
+source = "../imdb/title.crew.tsv"
+
+connection = sqlite3.connect("../imdb/imdb.db", isolation_level=None)
+connection.executescript("""
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-200000;
+""")
+
+with open(source, newline="") as f:
+    reader = csv.reader(f, delimiter="\t")
+    header = next(reader)
+
+    connection.execute("DROP TABLE IF EXISTS title_crew")
+    connection.execute(
+        "CREATE TABLE title_crew (%s)" % ", ".join(f"{name} TEXT" for name in header)
+    )
+
+    # executemany drains the csv reader lazily in C inside one
+    # transaction, so peak memory is a single row — no DataFrame or
+    # record batch ever exists
+    cursor = connection.cursor()
+    cursor.execute("BEGIN")
+    cursor.executemany(
+        "INSERT INTO title_crew VALUES (%s)" % ",".join("?" * len(header)),
+        reader,
+    )
+    connection.commit()
+
 connection.close()
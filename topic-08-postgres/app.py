@@ -16,6 +16,7 @@ database.initialize(
     user=os.environ.get('POSTGRES_USER', 'pets_app'),
     password=os.environ.get('POSTGRES_PASSWORD')
 )
+database.ensure_indexes()
 
 
 @app.route("/", methods=["GET"]) 
@@ -4,215 +4,547 @@ Adapted from Topic 4 SQLite version
 """
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.pool
+from psycopg2.extras import RealDictCursor, execute_batch, execute_values
+from contextlib import contextmanager
+from functools import lru_cache
+import csv
+import io
 import os
+import threading
 
-connection = None
+pool = None
+
+# kind table cache: tiny, read on every form render, rarely written
+_kinds_cache = None
 
 
 def initialize(host='localhost', database='pets_db', user='pets_app', password=None):
-    """Initialize PostgreSQL connection"""
-    global connection
-    
+    """Initialize a PostgreSQL connection pool"""
+    global pool, _kinds_cache
+    _kinds_cache = None
+    _get_kind_cached.cache_clear()
+
     # Get password from environment if not provided
     if password is None:
         password = os.environ.get('POSTGRES_PASSWORD', 'petsAppPassword456!')
-    
-    connection = psycopg2.connect(
+
+    if pool is not None:
+        pool.closeall()
+    _session_prepared.clear()
+
+    # Pooled connections skip the TCP + auth handshake on every request
+    # and let threaded servers overlap Postgres round trips
+    pool = psycopg2.pool.ThreadedConnectionPool(
+        minconn=2,
+        maxconn=int(os.environ.get('PG_POOL', 16)),
         host=host,
         database=database,
         user=user,
         password=password,
         cursor_factory=RealDictCursor  # Return rows as dictionaries
     )
-    # PostgreSQL uses autocommit=False by default (transactions)
-    connection.autocommit = False
+
+
+def ensure_indexes():
+    """Create the indexes the join queries rely on (idempotent)"""
+    with conn() as connection, connection.cursor() as cursor:
+        cursor.execute("CREATE INDEX IF NOT EXISTS pet_kind_id_idx ON pet(kind_id)")
+        connection.commit()
+
+
+# Server-side prepared statements: parse + rewrite + plan happen once
+# per session, EXECUTE skips them on every later call
+_PREPARED_STATEMENTS = [
+    """PREPARE get_pets_stmt AS
+       SELECT pet.id, pet.name, pet.age, pet.owner,
+              kind.name as kind_name, kind.food, kind.sound
+       FROM pet JOIN kind ON pet.kind_id = kind.id
+       ORDER BY pet.name""",
+    """PREPARE get_pet_stmt(int) AS
+       SELECT id, name, age, kind_id, owner FROM pet WHERE id = $1""",
+    """PREPARE get_kind_stmt(int) AS
+       SELECT id, name, food, sound FROM kind WHERE id = $1""",
+    """PREPARE create_pet_stmt(text, int, int, text) AS
+       INSERT INTO pet (name, age, kind_id, owner) VALUES ($1, $2, $3, $4)
+       RETURNING id, name, age, kind_id, owner""",
+    """PREPARE create_kind_stmt(text, text, text) AS
+       INSERT INTO kind (name, food, sound) VALUES ($1, $2, $3)
+       RETURNING id, name, food, sound""",
+    """PREPARE update_pet_stmt(text, int, int, text, int) AS
+       UPDATE pet SET name = $1, age = $2, kind_id = $3, owner = $4 WHERE id = $5""",
+    """PREPARE update_kind_stmt(text, text, text, int) AS
+       UPDATE kind SET name = $1, food = $2, sound = $3 WHERE id = $4""",
+    "PREPARE delete_pet_stmt(int) AS DELETE FROM pet WHERE id = $1",
+    "PREPARE delete_kind_stmt(int) AS DELETE FROM kind WHERE id = $1",
+]
+
+
+# prepared state per pooled session, keyed by id(connection): True once
+# the PREPAREs ran, False when the session cannot prepare (pgbouncer).
+# psycopg2's C connection type rejects ad-hoc attributes, so the flag
+# cannot live on the connection itself; entries are dropped when a
+# session is closed and cleared when the pool is rebuilt, so a recycled
+# id never inherits stale state
+_session_prepared = {}
+
+
+def _prepare_session(connection):
+    """Issue the PREPAREs once per pooled session
+
+    Under a transaction-pooling proxy (pgbouncer) PREPARE is not
+    session-safe and fails; those sessions fall back to plain SQL.
+    """
+    if _session_prepared.get(id(connection)) is not None:
+        return
+    try:
+        with connection.cursor() as cursor:
+            # pg12+ switches prepared statements to a generic plan after
+            # five executions; custom plans keep parameter-aware
+            # selectivity estimates for the id lookups and the join
+            if connection.server_version >= 120000:
+                cursor.execute("SET plan_cache_mode = 'force_custom_plan'")
+            for statement in _PREPARED_STATEMENTS:
+                cursor.execute(statement)
+        connection.commit()
+        _session_prepared[id(connection)] = True
+    except psycopg2.Error:
+        connection.rollback()
+        _session_prepared[id(connection)] = False
+
+
+def _execute(cursor, name, plain_sql, params=()):
+    """Run the named prepared statement, or its plain form if
+    this session could not prepare"""
+    if _session_prepared.get(id(cursor.connection), False):
+        if params:
+            placeholders = ", ".join(["%s"] * len(params))
+            cursor.execute(f"EXECUTE {name}({placeholders})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+    else:
+        cursor.execute(plain_sql, params)
+
+
+@contextmanager
+def pipeline(connection):
+    """Run the enclosed statements in libpq pipeline mode when the
+    driver supports it (psycopg 3); on psycopg2 this is a no-op and
+    callers rely on execute_batch/execute_values for batching."""
+    if hasattr(connection, "pipeline"):
+        with connection.pipeline():
+            yield
+    else:
+        yield
+
+
+# set while a transaction() block is active on this thread
+_active = threading.local()
+
+
+@contextmanager
+def transaction():
+    """Run several writes on one connection with a single commit
+
+    with transaction():
+        for p in pets:
+            create_pet(p)
+
+    pays one fsync for the whole block instead of one per row.
+    """
+    connection = pool.getconn()
+    _prepare_session(connection)
+    _active.connection = connection
+    try:
+        yield
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        _active.connection = None
+        pool.putconn(connection)
+
+
+def _maybe_commit(connection, commit):
+    # inside transaction() the single commit happens on block exit
+    in_transaction = getattr(_active, "connection", None) is not None
+    if not commit and not in_transaction:
+        # on a pooled connection the borrow is rolled back on return,
+        # so a deferred commit outside transaction() would silently
+        # discard the write
+        raise RuntimeError("commit=False requires an enclosing transaction() block")
+    if commit and not in_transaction:
+        connection.commit()
+
+
+@contextmanager
+def conn():
+    """Borrow a pooled connection for the duration of one operation"""
+    active = getattr(_active, "connection", None)
+    if active is not None:
+        # reuse the transaction's connection; transaction() owns
+        # commit/rollback and the return to the pool
+        yield active
+        return
+    connection = pool.getconn()
+    _prepare_session(connection)
+    try:
+        yield connection
+    finally:
+        # end any read-only transaction so the next borrower starts
+        # with a fresh snapshot; discard sessions that died mid-use
+        # rather than returning them to the pool
+        try:
+            connection.rollback()
+            pool.putconn(connection)
+        except psycopg2.Error:
+            _session_prepared.pop(id(connection), None)
+            pool.putconn(connection, close=True)
 
 
 def get_pets():
     """Retrieve all pets with kind information"""
-    cursor = connection.cursor()
-    cursor.execute("""
-        SELECT 
-            pet.id, 
-            pet.name, 
-            pet.age, 
-            pet.owner, 
-            kind.name as kind_name, 
-            kind.food, 
-            kind.sound 
-        FROM pet 
-        JOIN kind ON pet.kind_id = kind.id
-        ORDER BY pet.name
-    """)
-    pets = cursor.fetchall()
-    cursor.close()
-    return pets
+    # plain tuple rows here: one dict literal per row is cheaper than a
+    # RealDictRow allocation apiece on the widest query in the app;
+    # single-row endpoints keep the RealDict convenience
+    with conn() as connection, \
+            connection.cursor(cursor_factory=psycopg2.extensions.cursor) as cursor:
+        _execute(cursor, "get_pets_stmt", """
+            SELECT
+                pet.id,
+                pet.name,
+                pet.age,
+                pet.owner,
+                kind.name as kind_name,
+                kind.food,
+                kind.sound
+            FROM pet
+            JOIN kind ON pet.kind_id = kind.id
+            ORDER BY pet.name
+        """)
+        return [
+            {
+                "id": row[0],
+                "name": row[1],
+                "age": row[2],
+                "owner": row[3],
+                "kind_name": row[4],
+                "food": row[5],
+                "sound": row[6],
+            }
+            for row in cursor.fetchall()
+        ]
+
+
+def iter_pets(itersize=1000):
+    """Stream pets with kind information, itersize rows at a time
+
+    A named (server-side) cursor keeps at most itersize rows buffered
+    client-side, so memory stays bounded on large tables and the first
+    rows arrive before the query finishes. The pooled connection stays
+    borrowed until the generator is exhausted.
+    """
+    with conn() as connection:
+        with connection.cursor(name="pets_stream") as cursor:
+            cursor.itersize = itersize
+            cursor.execute("""
+                SELECT
+                    pet.id,
+                    pet.name,
+                    pet.age,
+                    pet.owner,
+                    kind.name as kind_name,
+                    kind.food,
+                    kind.sound
+                FROM pet
+                JOIN kind ON pet.kind_id = kind.id
+                ORDER BY pet.name
+            """)
+            yield from cursor
+
+
+def get_pets_with_kind():
+    """Retrieve the whole pet+kind hierarchy as one JSON value
+
+    The server does the join and the aggregation, so the app gets a
+    single row back instead of fetching pets and kinds separately.
+    """
+    with conn() as connection, connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT json_agg(
+                json_build_object(
+                    'id', pet.id,
+                    'name', pet.name,
+                    'age', pet.age,
+                    'owner', pet.owner,
+                    'kind_name', kind.name,
+                    'food', kind.food,
+                    'sound', kind.sound
+                ) ORDER BY pet.name
+            ) AS pets
+            FROM pet
+            JOIN kind ON pet.kind_id = kind.id
+        """)
+        row = cursor.fetchone()
+        return row["pets"] or []
 
 
 def get_kinds():
-    """Retrieve all pet kinds"""
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM kind ORDER BY name")
-    kinds = cursor.fetchall()
-    cursor.close()
-    return kinds
+    """Retrieve all pet kinds (cached until a kind is written)"""
+    global _kinds_cache
+    if _kinds_cache is None:
+        with conn() as connection, connection.cursor() as cursor:
+            cursor.execute("SELECT id, name, food, sound FROM kind ORDER BY name")
+            _kinds_cache = cursor.fetchall()
+    return _kinds_cache
 
 
 def get_pet(id):
     """Retrieve a single pet by ID"""
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM pet WHERE id = %s", (id,))
-    pet = cursor.fetchone()
-    cursor.close()
-    return pet if pet else {}
+    with conn() as connection, connection.cursor() as cursor:
+        _execute(
+            cursor, "get_pet_stmt",
+            "SELECT id, name, age, kind_id, owner FROM pet WHERE id = %s",
+            (id,),
+        )
+        pet = cursor.fetchone()
+        return pet if pet else {}
+
+
+@lru_cache(maxsize=128)
+def _get_kind_cached(id):
+    with conn() as connection, connection.cursor() as cursor:
+        _execute(
+            cursor, "get_kind_stmt",
+            "SELECT id, name, food, sound FROM kind WHERE id = %s",
+            (id,),
+        )
+        kind = cursor.fetchone()
+        return kind if kind else {}
 
 
 def get_kind(id):
-    """Retrieve a single kind by ID"""
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM kind WHERE id = %s", (id,))
-    kind = cursor.fetchone()
-    cursor.close()
-    return kind if kind else {}
+    """Retrieve a single kind by ID (cached until a kind is written)"""
+    # copy so callers cannot mutate the cached row
+    return dict(_get_kind_cached(int(id)))
+
+
+def _safe_age(raw):
+    """Coerce a form value to int without exception-driven control flow"""
+    if isinstance(raw, int):
+        return raw
+    if isinstance(raw, str):
+        digits = raw[1:] if raw.startswith("-") else raw
+        if digits.isdigit():
+            return int(raw)
+    return 0
+
+
+def create_pet(data, commit=True):
+    """Create a new pet and return the stored row (including its id)"""
+    data["age"] = _safe_age(data.get("age", 0))
+
+    with conn() as connection, connection.cursor() as cursor:
+        _execute(
+            cursor, "create_pet_stmt",
+            """INSERT INTO pet (name, age, kind_id, owner)
+               VALUES (%s, %s, %s, %s)
+               RETURNING id, name, age, kind_id, owner""",
+            (data["name"], data["age"], data["kind_id"], data["owner"])
+        )
+        row = cursor.fetchone()
+        _maybe_commit(connection, commit)
+        return row
+
+
+def create_kind(data, commit=True):
+    """Create a new kind and return the stored row (including its id)"""
+    global _kinds_cache
+    _kinds_cache = None
+    _get_kind_cached.cache_clear()
+    with conn() as connection, connection.cursor() as cursor:
+        _execute(
+            cursor, "create_kind_stmt",
+            """INSERT INTO kind (name, food, sound)
+               VALUES (%s, %s, %s)
+               RETURNING id, name, food, sound""",
+            (data["name"], data["food"], data["sound"])
+        )
+        row = cursor.fetchone()
+        _maybe_commit(connection, commit)
+        return row
 
 
-def create_pet(data):
-    """Create a new pet"""
-    try:
-        data["age"] = int(data.get("age", 0))
-    except (ValueError, TypeError):
-        data["age"] = 0
-    
-    cursor = connection.cursor()
-    cursor.execute(
-        """INSERT INTO pet (name, age, kind_id, owner) 
-           VALUES (%s, %s, %s, %s)""",
-        (data["name"], data["age"], data["kind_id"], data["owner"])
-    )
-    connection.commit()
-    cursor.close()
+def create_pets(data_list):
+    """Create many pets in batched round trips
 
+    execute_batch sends page_size INSERTs per network round trip;
+    cursor.rowcount only reflects the final page, so callers should not
+    rely on it.
+    """
+    rows = [
+        (d["name"], _safe_age(d.get("age", 0)), d["kind_id"], d["owner"])
+        for d in data_list
+    ]
+    with conn() as connection, connection.cursor() as cursor:
+        execute_batch(
+            cursor,
+            """INSERT INTO pet (name, age, kind_id, owner)
+               VALUES (%s, %s, %s, %s)""",
+            rows,
+            page_size=200,
+        )
+        connection.commit()
 
-def create_kind(data):
-    """Create a new kind"""
-    cursor = connection.cursor()
-    cursor.execute(
-        """INSERT INTO kind (name, food, sound) 
-           VALUES (%s, %s, %s)""",
-        (data["name"], data["food"], data["sound"])
-    )
-    connection.commit()
-    cursor.close()
 
+def update_pets(updates):
+    """Update many pets in batched round trips
 
-def update_pet(id, data):
+    updates is an iterable of (id, data) pairs; same rowcount caveat
+    as create_pets.
+    """
+    rows = [
+        (d["name"], _safe_age(d.get("age", 0)), d["kind_id"], d["owner"], id)
+        for id, d in updates
+    ]
+    with conn() as connection, connection.cursor() as cursor:
+        execute_batch(
+            cursor,
+            """UPDATE pet
+               SET name = %s, age = %s, kind_id = %s, owner = %s
+               WHERE id = %s""",
+            rows,
+            page_size=200,
+        )
+        connection.commit()
+
+
+def update_pet(id, data, commit=True):
     """Update an existing pet"""
-    try:
-        data["age"] = int(data.get("age", 0))
-    except (ValueError, TypeError):
-        data["age"] = 0
-    
-    cursor = connection.cursor()
-    cursor.execute(
-        """UPDATE pet 
-           SET name = %s, age = %s, kind_id = %s, owner = %s 
-           WHERE id = %s""",
-        (data["name"], data["age"], data["kind_id"], data["owner"], id)
-    )
-    connection.commit()
-    cursor.close()
+    data["age"] = _safe_age(data.get("age", 0))
+
+    with conn() as connection, connection.cursor() as cursor:
+        _execute(
+            cursor, "update_pet_stmt",
+            """UPDATE pet
+               SET name = %s, age = %s, kind_id = %s, owner = %s
+               WHERE id = %s""",
+            (data["name"], data["age"], data["kind_id"], data["owner"], id)
+        )
+        _maybe_commit(connection, commit)
 
 
-def update_kind(id, data):
+def update_kind(id, data, commit=True):
     """Update an existing kind"""
-    cursor = connection.cursor()
-    cursor.execute(
-        """UPDATE kind 
-           SET name = %s, food = %s, sound = %s 
-           WHERE id = %s""",
-        (data["name"], data["food"], data["sound"], id)
-    )
-    connection.commit()
-    cursor.close()
+    global _kinds_cache
+    _kinds_cache = None
+    _get_kind_cached.cache_clear()
+    with conn() as connection, connection.cursor() as cursor:
+        _execute(
+            cursor, "update_kind_stmt",
+            """UPDATE kind
+               SET name = %s, food = %s, sound = %s
+               WHERE id = %s""",
+            (data["name"], data["food"], data["sound"], id)
+        )
+        _maybe_commit(connection, commit)
 
 
-def delete_pet(id):
+def delete_pet(id, commit=True):
     """Delete a pet"""
-    cursor = connection.cursor()
-    cursor.execute("DELETE FROM pet WHERE id = %s", (id,))
-    connection.commit()
-    cursor.close()
+    with conn() as connection, connection.cursor() as cursor:
+        _execute(cursor, "delete_pet_stmt", "DELETE FROM pet WHERE id = %s", (id,))
+        _maybe_commit(connection, commit)
 
 
-def delete_kind(id):
+def delete_kind(id, commit=True):
     """Delete a kind (will fail if pets reference it due to foreign key)"""
-    cursor = connection.cursor()
-    try:
-        cursor.execute("DELETE FROM kind WHERE id = %s", (id,))
-        connection.commit()
-    except psycopg2.IntegrityError as e:
-        connection.rollback()
-        raise Exception(f"Cannot delete kind: pets still reference it") from e
-    finally:
-        cursor.close()
+    global _kinds_cache
+    _kinds_cache = None
+    _get_kind_cached.cache_clear()
+    with conn() as connection, connection.cursor() as cursor:
+        try:
+            _execute(cursor, "delete_kind_stmt", "DELETE FROM kind WHERE id = %s", (id,))
+            _maybe_commit(connection, commit)
+        except psycopg2.IntegrityError as e:
+            connection.rollback()
+            raise Exception(f"Cannot delete kind: pets still reference it") from e
 
 
 # Testing functions
 def setup_test_database():
     """Set up test database with sample data"""
     initialize(database='test_pets_db')
-    
-    cursor = connection.cursor()
-    
-    # Drop and recreate tables
-    cursor.execute("DROP TABLE IF EXISTS pet CASCADE")
-    cursor.execute("DROP TABLE IF EXISTS kind CASCADE")
-    
-    cursor.execute("""
-        CREATE TABLE kind (
-            id SERIAL PRIMARY KEY,
-            name VARCHAR(50) NOT NULL,
-            food VARCHAR(100),
-            sound VARCHAR(50)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE pet (
-            id SERIAL PRIMARY KEY,
-            name VARCHAR(100) NOT NULL,
-            kind_id INTEGER NOT NULL,
-            age INTEGER,
-            owner VARCHAR(100),
-            FOREIGN KEY (kind_id) REFERENCES kind(id) ON DELETE RESTRICT
+
+    with conn() as connection, connection.cursor() as cursor:
+        # Drop and recreate tables
+        cursor.execute("DROP TABLE IF EXISTS pet CASCADE")
+        cursor.execute("DROP TABLE IF EXISTS kind CASCADE")
+
+        cursor.execute("""
+            CREATE TABLE kind (
+                id SERIAL PRIMARY KEY,
+                name VARCHAR(50) NOT NULL,
+                food VARCHAR(100),
+                sound VARCHAR(50)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE pet (
+                id SERIAL PRIMARY KEY,
+                name VARCHAR(100) NOT NULL,
+                kind_id INTEGER NOT NULL,
+                age INTEGER,
+                owner VARCHAR(100),
+                FOREIGN KEY (kind_id) REFERENCES kind(id) ON DELETE RESTRICT
+            )
+        """)
+
+        connection.commit()
+
+        # Insert test data. The kind rows go through the pipeline
+        # wrapper (one Sync on pipeline-capable drivers, no-op here);
+        # pets go through COPY, Postgres's bulk-load path, which
+        # streams rows without per-statement parse/plan overhead and
+        # scales to much larger seed sets unchanged. COPY stays outside
+        # the pipeline block because psycopg3 disallows COPY in
+        # pipeline mode
+        with pipeline(connection):
+            execute_values(
+                cursor,
+                "INSERT INTO kind (name, food, sound) VALUES %s",
+                [
+                    ("dog", "dogfood", "bark"),
+                    ("cat", "catfood", "meow"),
+                ],
+                page_size=1000,
+            )
+
+        pets = [
+            {"name": "dorothy", "kind_id": 1, "age": 9, "owner": "greg"},
+            {"name": "suzy", "kind_id": 1, "age": 9, "owner": "greg"},
+            {"name": "casey", "kind_id": 2, "age": 9, "owner": "greg"},
+            {"name": "heidi", "kind_id": 2, "age": 15, "owner": "david"},
+        ]
+        # CSV via csv.writer so names with tabs/newlines/quotes are
+        # escaped correctly instead of corrupting the plain-text format
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for pet in pets:
+            writer.writerow([pet["name"], pet["age"], pet["kind_id"], pet["owner"]])
+        buf.seek(0)
+        cursor.copy_expert(
+            "COPY pet (name, age, kind_id, owner) FROM STDIN WITH CSV", buf
         )
-    """)
-    
-    connection.commit()
-    
-    # Insert test data
-    cursor.execute(
-        "INSERT INTO kind (name, food, sound) VALUES (%s, %s, %s)",
-        ("dog", "dogfood", "bark")
-    )
-    cursor.execute(
-        "INSERT INTO kind (name, food, sound) VALUES (%s, %s, %s)",
-        ("cat", "catfood", "meow")
-    )
-    connection.commit()
-    
-    pets = [
-        {"name": "dorothy", "kind_id": 1, "age": 9, "owner": "greg"},
-        {"name": "suzy", "kind_id": 1, "age": 9, "owner": "greg"},
-        {"name": "casey", "kind_id": 2, "age": 9, "owner": "greg"},
-        {"name": "heidi", "kind_id": 2, "age": 15, "owner": "david"},
-    ]
-    
-    for pet in pets:
-        create_pet(pet)
-    
-    cursor.close()
+        connection.commit()
+
+        # tables were just rebuilt; drop this session's plans so the
+        # next borrow re-PREPAREs without "already exists" collisions
+        cursor.execute("DEALLOCATE ALL")
+        connection.commit()
+        _session_prepared.pop(id(connection), None)
 
 
 def test_get_pets():
@@ -223,11 +555,11 @@ def test_get_pets():
     assert type(pets[0]) is dict
     pet = pets[0]
     print(f"Sample pet: {pet}")
-    
+
     required_fields = ["id", "name", "age", "owner", "kind_name"]
     for field in required_fields:
         assert field in pet, f"Field {field} missing from {pet}"
-    
+
     print("✓ get_pets test passed")
 
 
@@ -238,11 +570,11 @@ def test_get_kinds():
     assert len(kinds) > 0
     assert type(kinds[0]) is dict
     kind = kinds[0]
-    
+
     required_fields = ["id", "name", "food", "sound"]
     for field in required_fields:
         assert field in kind, f"Field {field} missing from {kind}"
-    
+
     print("✓ get_kinds test passed")
 
 
@@ -250,12 +582,12 @@ if __name__ == "__main__":
     # Note: You need to create test_pets_db first:
     # psql -U postgres -c "CREATE DATABASE test_pets_db;"
     # psql -U postgres -c "GRANT ALL PRIVILEGES ON DATABASE test_pets_db TO pets_app;"
-    
+
     print("Setting up test database...")
     setup_test_database()
-    
+
     print("\nRunning tests...")
     test_get_pets()
     test_get_kinds()
-    
+
     print("\n✓ All tests passed!")
@@ -0,0 +1,119 @@
+"""
+Async PostgreSQL access for the pets application
+
+asyncpg companion to database.py: async web frontends can overlap
+database waits instead of blocking a thread per query. asyncpg speaks
+the binary protocol and keeps its own per-connection prepared-statement
+cache, so there is no PREPARE bootstrap here.
+"""
+
+import asyncio
+import os
+
+import asyncpg
+
+pool = None
+
+
+async def initialize(host='localhost', database='pets_db', user='pets_app', password=None):
+    """Create the shared asyncpg pool"""
+    global pool
+
+    # Get password from environment if not provided
+    if password is None:
+        password = os.environ.get('POSTGRES_PASSWORD', 'petsAppPassword456!')
+
+    if pool is not None:
+        await pool.close()
+
+    pool = await asyncpg.create_pool(
+        host=host,
+        database=database,
+        user=user,
+        password=password,
+        min_size=2,
+        max_size=int(os.environ.get('PG_POOL', 16)),
+        statement_cache_size=200,
+    )
+
+
+async def get_pets():
+    """Retrieve all pets with kind information"""
+    async with pool.acquire() as connection:
+        rows = await connection.fetch("""
+            SELECT
+                pet.id,
+                pet.name,
+                pet.age,
+                pet.owner,
+                kind.name as kind_name,
+                kind.food,
+                kind.sound
+            FROM pet
+            JOIN kind ON pet.kind_id = kind.id
+            ORDER BY pet.name
+        """)
+        return [dict(row) for row in rows]
+
+
+async def get_kinds():
+    """Retrieve all pet kinds"""
+    async with pool.acquire() as connection:
+        rows = await connection.fetch(
+            "SELECT id, name, food, sound FROM kind ORDER BY name"
+        )
+        return [dict(row) for row in rows]
+
+
+async def get_pet(id):
+    """Retrieve a single pet by ID"""
+    async with pool.acquire() as connection:
+        row = await connection.fetchrow(
+            "SELECT id, name, age, kind_id, owner FROM pet WHERE id = $1", int(id)
+        )
+        return dict(row) if row else {}
+
+
+async def get_kind(id):
+    """Retrieve a single kind by ID"""
+    async with pool.acquire() as connection:
+        row = await connection.fetchrow(
+            "SELECT id, name, food, sound FROM kind WHERE id = $1", int(id)
+        )
+        return dict(row) if row else {}
+
+
+async def create_pet(data):
+    """Create a new pet and return the stored row (including its id)"""
+    async with pool.acquire() as connection:
+        row = await connection.fetchrow(
+            """INSERT INTO pet (name, age, kind_id, owner)
+               VALUES ($1, $2, $3, $4)
+               RETURNING id, name, age, kind_id, owner""",
+            data["name"], int(data.get("age", 0) or 0),
+            int(data["kind_id"]), data["owner"],
+        )
+        return dict(row)
+
+
+async def update_pet(id, data):
+    """Update an existing pet"""
+    async with pool.acquire() as connection:
+        await connection.execute(
+            """UPDATE pet
+               SET name = $1, age = $2, kind_id = $3, owner = $4
+               WHERE id = $5""",
+            data["name"], int(data.get("age", 0) or 0),
+            int(data["kind_id"]), data["owner"], int(id),
+        )
+
+
+async def delete_pet(id):
+    """Delete a pet"""
+    async with pool.acquire() as connection:
+        await connection.execute("DELETE FROM pet WHERE id = $1", int(id))
+
+
+def run(coro):
+    """Sync convenience wrapper for CLI use: run(get_pets())"""
+    return asyncio.run(coro)
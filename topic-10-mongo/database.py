@@ -1,22 +1,90 @@
+from functools import lru_cache
+
 from mongita import MongitaClientDisk
 from bson.objectid import ObjectId
 
 client = MongitaClientDisk()
 pets_db = client.pets_db
 
+# one handle per collection instead of an attribute lookup (and wrapper
+# construction) in every function
+pets_collection = pets_db.pets_collection
+kind_collection = pets_db.kind_collection
+
+# indexed lookups for every queried field; create_index is idempotent
+pets_collection.create_index("name")
+pets_collection.create_index("kind_id")
+kind_collection.create_index("kind_name")
+
+# kind _id -> document, rebuilt on first read after a kind write;
+# saves a find_one disk read per pet on every list
+_kinds_cache = None
+
+
+def _kinds_by_id():
+    global _kinds_cache
+    if _kinds_cache is None:
+        _kinds_cache = {kind["_id"]: kind for kind in kind_collection.find()}
+    return _kinds_cache
+
+
 # PETS
 
 def retrieve_pets():
-    pets_collection = pets_db.pets_collection
-    kind_collection = pets_db.kind_collection
-    pets = list(pets_collection.find())
-    for pet in pets:
-        pet["id"] = str(pet["_id"])
-        del pet["_id"]
-        kind = kind_collection.find_one({"_id": pet["kind_id"]})
-        for tag in ["kind_name", "noise", "food"]:
-            pet[tag] = kind[tag]
-        del pet["kind_id"]
+    kinds_by_id = _kinds_by_id()
+    # one dict literal per pet instead of six mutations on the raw doc
+    pets = []
+    for pet in pets_collection.find():
+        kind = kinds_by_id[pet["kind_id"]]
+        pets.append({
+            "id": str(pet["_id"]),
+            "name": pet["name"],
+            "age": pet["age"],
+            "owner": pet["owner"],
+            "kind_name": kind["kind_name"],
+            "noise": kind["noise"],
+            "food": kind["food"],
+        })
+    return pets
+
+
+def iter_pets(query=None):
+    # lazy cursor over the raw documents: a caller scanning for one hit
+    # stops reading early and no list is ever materialized
+    for pet in pets_collection.find(query or {}):
+        pet["id"] = str(pet.pop("_id"))
+        yield pet
+
+
+def retrieve_pets_agg():
+    # real MongoDB joins pets to kinds server-side in one round trip;
+    # mongita raises on .aggregate (not an AttributeError, so no hasattr)
+    # and those stores fall back to the cached dict-join above
+    try:
+        aggregate = pets_collection.aggregate
+    except Exception:
+        return retrieve_pets()
+    pipeline = [
+        {"$lookup": {
+            "from": "kind_collection",
+            "localField": "kind_id",
+            "foreignField": "_id",
+            "as": "kind",
+        }},
+        {"$unwind": "$kind"},
+        {"$project": {
+            "name": 1,
+            "age": 1,
+            "owner": 1,
+            "kind_name": "$kind.kind_name",
+            "noise": "$kind.noise",
+            "food": "$kind.food",
+        }},
+    ]
+    pets = []
+    for pet in aggregate(pipeline):
+        pet["id"] = str(pet.pop("_id"))
+        pets.append(pet)
     return pets
 
 
@@ -36,10 +104,16 @@ def test_retrieve_pets():
         "food": "Dog food",
         "noise": "Bark",
     }
+    # same shape from the aggregation path (dict-join fallback on mongita)
+    pets = retrieve_pets_agg()
+    assert type(pets) is list
+    assert pets[0]["name"] == "Suzy"
+    # lazy iteration stops at the first hit
+    suzy = next((p for p in iter_pets({"name": "Suzy"})), None)
+    assert suzy is not None and suzy["owner"] == "Greg"
 
 
 def retrieve_pet(id):
-    pets_collection = pets_db.pets_collection
     id = ObjectId(id)
     pet = pets_collection.find_one({"_id": id})
     pet["id"] = str(pet["_id"])
@@ -57,54 +131,41 @@ def test_retrieve_pet():
 
 
 def create_pet(data):
-    pets_collection = pets_db.pets_collection
     data["kind_id"] = ObjectId(data["kind_id"])
     pets_collection.insert_one(data)
 
 
 def delete_pet(id):
-    pets_collection = pets_db.pets_collection
     pets_collection.delete_one({"_id": ObjectId(id)})
 
 
 def test_create_and_delete_pet():
-    kind_collection = pets_db.kind_collection
     kind = kind_collection.find_one({"kind_name": "Dog"})
     example_kind_id = str(kind["_id"])
     print("test create_and_delete_pet")
-    pets = retrieve_pets()
-    for pet in pets:
-        if pet["name"] == "gamma":
-            delete_pet(pet["id"])
+    # push the predicate to the storage engine instead of retrieving
+    # every pet and scanning in Python
+    leftover = pets_collection.find_one({"name": "gamma", "owner": "delta"})
+    if leftover:
+        delete_pet(str(leftover["_id"]))
     data = {"name": "gamma", "age": 12, "kind_id": example_kind_id, "owner": "delta"}
     create_pet(data)
-    pets = retrieve_pets()
-    found = False
-    for pet in pets:
-        if pet["name"] == "gamma" and pet["owner"] == "delta":
-            assert pet["age"] == 12
-            assert pet["kind_name"] == "Dog"
-            found = True
-            id = pet["id"]
-    assert found
-    delete_pet(id)
-    pets = retrieve_pets()
-    found = False
-    for pet in pets:
-        if pet["name"] == "gamma" and pet["owner"] == "delta":
-            found = True
-    assert not found
+    pet = pets_collection.find_one({"name": "gamma", "owner": "delta"})
+    assert pet is not None
+    assert pet["age"] == 12
+    kind = kind_collection.find_one({"_id": pet["kind_id"]})
+    assert kind["kind_name"] == "Dog"
+    delete_pet(str(pet["_id"]))
+    assert pets_collection.find_one({"name": "gamma", "owner": "delta"}) is None
 
 
 def update_pet(id, data):
-    pets_collection = pets_db.pets_collection
     data["kind_id"] = ObjectId(data["kind_id"])
     pets_collection.update_one({"_id": ObjectId(id)}, {"$set": data})
 
 
 def test_update_pet():
     print("test update_pet")
-    pets_collection = pets_db.pets_collection
     # find the reference id
     pet_saved = pets_collection.find_one()
     id = str(pet_saved["_id"])
@@ -129,7 +190,6 @@ def test_update_pet():
 # KINDS
 
 def retrieve_kinds():
-    kind_collection = pets_db.kind_collection
     kinds = list(kind_collection.find())
     for kind in kinds:
         kind["id"] = str(kind["_id"])
@@ -148,12 +208,16 @@ def test_retrieve_kinds():
 
 
 def create_kind(data):
-    kind_collection = pets_db.kind_collection
+    global _kinds_cache
+    _kinds_cache = None
+    _retrieve_kind_cached.cache_clear()
     kind_collection.insert_one(data)
 
 
 def delete_kind(id):
-    kind_collection = pets_db.kind_collection
+    global _kinds_cache
+    _kinds_cache = None
+    _retrieve_kind_cached.cache_clear()
     kind_collection.delete_one({"_id": ObjectId(id)})
 
 
@@ -161,31 +225,25 @@ def test_create_and_delete_kind():
     print("test create_and_delete_kind")
     data = {"kind_name": "bunny", "food": "carrot", "noise": "hophop"}
     create_kind(data)
-    kinds = retrieve_kinds()
-    found = False
-    for kind in kinds:
-        if kind["kind_name"] == "bunny" and kind["food"] == "carrot":
-            found = True
-            kind_id = kind["id"]
-    assert found
-    delete_kind(kind_id)
-    kinds = retrieve_kinds()
-    found = False
-    for kind in kinds:
-        if kind["kind_name"] == "bunny" and kind["food"] == "carrot":
-            found = True
-    assert not found
+    kind = kind_collection.find_one({"kind_name": "bunny", "food": "carrot"})
+    assert kind is not None
+    delete_kind(str(kind["_id"]))
+    assert kind_collection.find_one({"kind_name": "bunny", "food": "carrot"}) is None
 
 
-def retrieve_kind(id):
-    kind_collection = pets_db.kind_collection
-    _id = ObjectId(id)
-    kind = kind_collection.find_one({"_id": _id})
+@lru_cache(maxsize=128)
+def _retrieve_kind_cached(id):
+    kind = kind_collection.find_one({"_id": ObjectId(id)})
     kind["id"] = str(kind["_id"])
     del kind["_id"]
     return kind
 
 
+def retrieve_kind(id):
+    # copy so callers cannot mutate the cached document
+    return dict(_retrieve_kind_cached(str(id)))
+
+
 def test_retrieve_kind():
     print("test retrieve_kind")
     kinds = retrieve_kinds()
@@ -195,7 +253,9 @@ def test_retrieve_kind():
 
 
 def update_kind(id, data):
-    kind_collection = pets_db.kind_collection
+    global _kinds_cache
+    _kinds_cache = None
+    _retrieve_kind_cached.cache_clear()
     kind_collection.update_one({"_id": ObjectId(id)}, {"$set": data})
 
 